@@ -2,23 +2,61 @@
 Configuration management for RaceMates.
 
 This module stores and retrieves application settings such as the
-overlay window position and the timestamp of the last pro driver list
-update.  Configuration is persisted in JSON format inside the user's
-home directory.  On Windows systems the file is placed in
+overlay window position, the timestamp of the last pro driver list
+update and the HTTP validators used to re-download that list.
+Configuration is persisted in JSON format inside the user's home
+directory.  On Windows systems the file is placed in
 ``%APPDATA%\RaceMates\config.json``; on other platforms it falls back
 to ``~/.racemates/config.json``.  Although iRacing is a Windows-only
 application, this fallback keeps the code portable and easy to test.
+
+The configuration is loaded from disk once and then held in memory.
+Setters update that dictionary in place and mark it dirty; it is
+written back by ``flush_config``, which also runs at interpreter exit.
+A GUI can register a scheduler with ``set_flush_scheduler`` to debounce
+these writes (e.g. with a ``QTimer``); without one, every change is
+flushed immediately.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
 
 CONFIG_FILENAME = "config.json"
 
+# In-memory configuration, loaded on first access
+_CONFIG_CACHE: Optional[Dict[str, object]] = None
+# Whether the in-memory configuration has changes not yet on disk
+_CONFIG_DIRTY: bool = False
+# Guards the cache; settings are changed from both the GUI and worker threads
+_CONFIG_LOCK = threading.RLock()
+# Optional callback that arranges for ``flush_config`` to run later
+_FLUSH_SCHEDULER: Optional[Callable[[], None]] = None
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON, using ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialise to indented JSON, using ``orjson`` when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
 def _get_config_dir() -> Path:
     """Return the directory where configuration data should be stored."""
     # Use APPDATA on Windows if available
@@ -41,8 +79,8 @@ def _get_config_path() -> Path:
     return _ensure_config_dir() / CONFIG_FILENAME
 
 
-def _read_config() -> Dict[str, object]:
-    """Read the configuration file and return a dictionary.
+def _load_config() -> Dict[str, object]:
+    """Read the configuration file from disk and return a dictionary.
 
     If the file does not exist or cannot be parsed, an empty dict is
     returned.
@@ -51,21 +89,66 @@ def _read_config() -> Dict[str, object]:
     if not path.exists():
         return {}
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return _json_loads(path.read_bytes())
     except Exception:
         return {}
 
 
-def _write_config(cfg: Dict[str, object]) -> None:
-    """Write the configuration dictionary to disk."""
-    path = _get_config_path()
-    try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=2)
-    except Exception:
-        # Fail silently; configuration errors should not crash the app
-        pass
+def _read_config() -> Dict[str, object]:
+    """Return the in-memory configuration, loading it from disk once."""
+    global _CONFIG_CACHE
+    with _CONFIG_LOCK:
+        if _CONFIG_CACHE is None:
+            _CONFIG_CACHE = _load_config()
+        return _CONFIG_CACHE
+
+
+def _update_config(**values: object) -> None:
+    """Update keys of the in-memory configuration and schedule a flush.
+
+    Nothing is scheduled if every value is already set, so repeated
+    identical updates never touch the disk.
+    """
+    global _CONFIG_DIRTY
+    with _CONFIG_LOCK:
+        cfg = _read_config()
+        if all(cfg.get(k) == v for k, v in values.items()):
+            return
+        cfg.update(values)
+        _CONFIG_DIRTY = True
+    if _FLUSH_SCHEDULER is not None:
+        _FLUSH_SCHEDULER()
+    else:
+        flush_config()
+
+
+def flush_config() -> None:
+    """Write the in-memory configuration to disk if it has changed."""
+    global _CONFIG_DIRTY
+    with _CONFIG_LOCK:
+        if not _CONFIG_DIRTY or _CONFIG_CACHE is None:
+            return
+        path = _get_config_path()
+        try:
+            path.write_text(_json_dumps(_CONFIG_CACHE), encoding="utf-8")
+            _CONFIG_DIRTY = False
+        except Exception:
+            # Fail silently; configuration errors should not crash the app
+            pass
+
+
+atexit.register(flush_config)
+
+
+def set_flush_scheduler(scheduler: Optional[Callable[[], None]]) -> None:
+    """Register a callback used to defer writing the configuration.
+
+    The callback is invoked (possibly from a worker thread) whenever the
+    configuration changes and should arrange for ``flush_config`` to be
+    called shortly afterwards.  Pass ``None`` to flush on every change.
+    """
+    global _FLUSH_SCHEDULER
+    _FLUSH_SCHEDULER = scheduler
 
 
 def get_window_position() -> Tuple[int, int]:
@@ -84,9 +167,7 @@ def get_window_position() -> Tuple[int, int]:
 
 def set_window_position(x: int, y: int) -> None:
     """Persist the overlay window position to the configuration file."""
-    cfg = _read_config()
-    cfg["window_position"] = [int(x), int(y)]
-    _write_config(cfg)
+    _update_config(window_position=[int(x), int(y)])
 
 
 def get_last_pro_update() -> float:
@@ -103,6 +184,24 @@ def get_last_pro_update() -> float:
 
 def set_last_pro_update(timestamp: float) -> None:
     """Persist the timestamp of the last pro driver list update."""
+    _update_config(last_pro_update=float(timestamp))
+
+
+def get_pro_list_validators() -> Tuple[Optional[str], Optional[str]]:
+    """Return the saved ``(ETag, Last-Modified)`` of the pro driver list.
+
+    Either value is ``None`` if the server did not provide it or no
+    list has been downloaded yet.
+    """
     cfg = _read_config()
-    cfg["last_pro_update"] = float(timestamp)
-    _write_config(cfg)
\ No newline at end of file
+    etag = cfg.get("pro_list_etag")
+    last_modified = cfg.get("pro_list_last_modified")
+    return (
+        etag if isinstance(etag, str) else None,
+        last_modified if isinstance(last_modified, str) else None,
+    )
+
+
+def set_pro_list_validators(etag: Optional[str], last_modified: Optional[str]) -> None:
+    """Persist the ``ETag`` and ``Last-Modified`` of the pro driver list."""
+    _update_config(pro_list_etag=etag, pro_list_last_modified=last_modified)
@@ -12,8 +12,10 @@ import argparse
 import sys
 import logging
 
+from PySide6.QtCore import QMetaObject, Qt, QTimer
 from PySide6.QtWidgets import QApplication
 
+from .config_manager import flush_config, set_flush_scheduler
 from .telemetry_listener import TelemetryListener
 from .overlay import OverlayWindow
 
@@ -35,13 +37,35 @@ def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv or sys.argv[1:])
 
     app = QApplication(sys.argv)
+
+    # Debounce configuration writes (e.g. repeated overlay moves) so the
+    # file is written at most once per burst of changes.  The timer is
+    # started via a queued call because settings may change on worker
+    # threads.
+    config_flush_timer = QTimer()
+    config_flush_timer.setSingleShot(True)
+    config_flush_timer.setInterval(500)
+    config_flush_timer.timeout.connect(flush_config)
+    set_flush_scheduler(
+        lambda: QMetaObject.invokeMethod(
+            config_flush_timer, "start", Qt.QueuedConnection
+        )
+    )
+
     overlay = OverlayWindow()
     overlay.show()  # Show initially; visibility managed by signals
 
     telemetry_listener = TelemetryListener(poll_interval=0.2)
-    # Connect signals
-    telemetry_listener.drivers_updated.connect(overlay.update_pro_drivers)
-    telemetry_listener.session_active.connect(overlay.setVisible)
+    # Connect signals.  The listener emits from its own thread, so the
+    # connections are queued explicitly; driver lists are pulled from
+    # the listener rather than copied through the signal.
+    overlay.set_driver_source(telemetry_listener.snapshot)
+    telemetry_listener.drivers_updated.connect(
+        overlay.on_drivers_updated, Qt.QueuedConnection
+    )
+    telemetry_listener.session_active.connect(
+        overlay.setVisible, Qt.QueuedConnection
+    )
 
     # Start telemetry thread
     telemetry_listener.start()
@@ -50,6 +74,8 @@ def main(argv: list[str] | None = None) -> int:
         ret = app.exec()
     finally:
         telemetry_listener.stop()
+        set_flush_scheduler(None)
+        flush_config()
     return ret
 
 
@@ -7,18 +7,22 @@ subscribes to signals from the ``TelemetryListener`` to update its
 contents and visibility.  The window can be moved by dragging with the
 mouse; its position is persisted between sessions using
 ``config_manager``.
+
+The driver rows are drawn by ``ProListOverlay``, a small widget that
+renders its text into a cached ``QPixmap`` with ``QPainter`` instead of
+using a full item view.
 """
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Tuple
 
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import Qt, QPoint, QRect, QSize, QTimer, Slot
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QSizePolicy,
     QVBoxLayout,
     QWidget,
 )
@@ -26,9 +30,117 @@ from PySide6.QtWidgets import (
 from .config_manager import get_window_position, set_window_position
 
 
+class ProListOverlay(QWidget):
+    """A read-only list of text rows drawn directly with ``QPainter``.
+
+    The rows are rendered into a cached ``QPixmap`` only when their
+    content or the widget's device pixel ratio changes; ``paintEvent`` just fills the background and blits
+    that pixmap.
+    """
+
+    _BACKGROUND = QColor(0, 0, 0, 160)
+    _PAD_X = 4
+    _PAD_Y = 2
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        # Purely a display: never take focus, track the mouse or handle
+        # clicks (drags fall through to the overlay window), and skip
+        # the background erase since paintEvent fills the whole rect.
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setMouseTracking(False)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self._font = QFont(self.font())
+        self._metrics = QFontMetrics(self._font)
+        self._rows: List[Tuple[str, QColor]] = []
+        self._line_height = 0
+        self._text_width = 0
+        self._pixmap: QPixmap | None = None
+        self._content_hash: int | None = None
+        self._size_hint = QSize(0, 0)
+
+    def sizeHint(self) -> QSize:
+        return self._size_hint
+
+    def minimumSizeHint(self) -> QSize:
+        return self._size_hint
+
+    def set_rows(self, rows: List[Tuple[str, QColor]]) -> bool:
+        """Replace the displayed rows, re-rendering only if they changed.
+
+        Returns True if the rows changed and the widget was re-rendered.
+        """
+        h = hash(tuple((text, color.rgba()) for text, color in rows))
+        if h == self._content_hash:
+            return False
+        self._content_hash = h
+
+        self._rows = list(rows)
+        self._line_height = self._metrics.height() + 2 * self._PAD_Y
+        self._text_width = max(
+            (self._metrics.horizontalAdvance(text) for text, _ in rows), default=0
+        )
+        width = self._text_width + 2 * self._PAD_X
+        height = self._line_height * len(rows)
+        self._render_pixmap(width, height)
+
+        self._size_hint = QSize(width, height)
+        self.setFixedHeight(height)
+        self.updateGeometry()
+        self.update()
+        return True
+
+    def _render_pixmap(self, width: int, height: int) -> None:
+        """Render the current rows at the widget's device pixel ratio."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        try:
+            painter.setFont(self._font)
+            for i, (text, color) in enumerate(self._rows):
+                painter.setPen(color)
+                painter.drawText(
+                    QRect(
+                        self._PAD_X,
+                        i * self._line_height,
+                        self._text_width,
+                        self._line_height,
+                    ),
+                    Qt.AlignLeft | Qt.AlignVCenter,
+                    text,
+                )
+        finally:
+            painter.end()
+        self._pixmap = pixmap
+
+    def paintEvent(self, event) -> None:
+        # The window may have moved to a screen with a different scale
+        # factor since the pixmap was rendered; re-render it if so.
+        if (
+            self._pixmap is not None
+            and self._pixmap.devicePixelRatio() != self.devicePixelRatioF()
+        ):
+            self._render_pixmap(self._size_hint.width(), self._size_hint.height())
+        painter = QPainter(self)
+        try:
+            painter.fillRect(self.rect(), self._BACKGROUND)
+            if self._pixmap is not None:
+                painter.drawPixmap(0, 0, self._pixmap)
+        finally:
+            painter.end()
+
+
 class OverlayWindow(QWidget):
     """A frameless, draggable overlay listing professional drivers."""
 
+    # Row colours, allocated once and shared by every row
+    _COLOR_YELLOW = QColor("yellow")
+    _COLOR_GRAY = QColor("gray")
+
     def __init__(self) -> None:
         super().__init__(
             flags=Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool
@@ -49,20 +161,24 @@ class OverlayWindow(QWidget):
         )
         layout.addWidget(self.title_label)
 
-        self.list_widget = QListWidget()
-        self.list_widget.setStyleSheet(
-            "QListWidget { background-color: rgba(0, 0, 0, 160); color: white; border: none; } "
-            "QListWidget::item { padding: 2px 4px; } "
-            "QListWidget::item:selected { background-color: rgba(255, 255, 255, 50); }"
-        )
-        self.list_widget.setFrameShape(QListWidget.NoFrame)
-        layout.addWidget(self.list_widget)
+        self.driver_list = ProListOverlay()
+        layout.addWidget(self.driver_list)
 
         self.setLayout(layout)
 
+        # Source of the latest driver list and the generation last shown
+        self._driver_source: Callable[[], Tuple[int, List[Dict[str, Any]]]] | None = None
+        self._shown_generation: int | None = None
+
         # Variables for dragging
         self._dragging = False
         self._drag_start_pos: QPoint | None = None
+        # Drag moves are coalesced and applied at most once per frame
+        self._pending_pos: QPoint | None = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setInterval(16)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.timeout.connect(self._apply_pending_move)
 
         # Restore previous position or default to top right
         self._apply_initial_position()
@@ -83,34 +199,62 @@ class OverlayWindow(QWidget):
                 y = rect.top() + 20
                 self.move(x, y)
 
+    @staticmethod
+    def _format_driver(drv: Dict[str, Any]) -> str:
+        """Return the display text for a single pro driver."""
+        name = drv.get("Name", "")
+        desc = drv.get("Description", "")
+        car_num = drv.get("CarNumber", "")
+        parts = []
+        if car_num:
+            parts.append(car_num)
+        if name:
+            parts.append(name)
+        if desc:
+            parts.append(f"({desc})")
+        text = " – ".join(parts[:2])  # join car number and name with dash
+        if desc:
+            # Append description separated by space
+            text = f"{text} {desc}"
+        return text
+
+    def set_driver_source(
+        self, source: Callable[[], Tuple[int, List[Dict[str, Any]]]]
+    ) -> None:
+        """Set the callable returning ``(generation, pro_drivers)``.
+
+        Typically ``TelemetryListener.snapshot``; it is read whenever
+        ``on_drivers_updated`` is invoked.
+        """
+        self._driver_source = source
+
+    @Slot(int)
+    def on_drivers_updated(self, generation: int) -> None:
+        """Pull the latest driver list from the driver source and show it.
+
+        Several queued notifications may arrive for a single snapshot;
+        only the first one for a given generation updates the display.
+        """
+        if self._driver_source is None:
+            return
+        latest_generation, pro_drivers = self._driver_source()
+        if latest_generation == self._shown_generation:
+            return
+        self._shown_generation = latest_generation
+        self.update_pro_drivers(pro_drivers)
+
     def update_pro_drivers(self, pro_drivers: List[Dict[str, Any]]) -> None:
         """Update the list of professional drivers shown in the overlay."""
-        self.list_widget.clear()
         if not pro_drivers:
-            item = QListWidgetItem("No pro drivers in session")
-            item.setForeground(Qt.gray)
-            self.list_widget.addItem(item)
+            rows = [("No pro drivers in session", self._COLOR_GRAY)]
         else:
-            for drv in pro_drivers:
-                name = drv.get("Name", "")
-                desc = drv.get("Description", "")
-                car_num = drv.get("CarNumber", "")
-                parts = []
-                if car_num:
-                    parts.append(car_num)
-                if name:
-                    parts.append(name)
-                if desc:
-                    parts.append(f"({desc})")
-                text = " – ".join(parts[:2])  # join car number and name with dash
-                if desc:
-                    # Append description separated by space
-                    text = f"{text} {desc}"
-                item = QListWidgetItem(text)
-                item.setForeground(Qt.yellow)
-                self.list_widget.addItem(item)
-        # Resize to fit content roughly
-        self.adjustSize()
+            rows = [
+                (self._format_driver(drv), self._COLOR_YELLOW)
+                for drv in pro_drivers
+            ]
+        if self.driver_list.set_rows(rows):
+            # Resize to fit content roughly
+            self.adjustSize()
 
     # Dragging behavior
     def mousePressEvent(self, event) -> None:
@@ -126,7 +270,11 @@ class OverlayWindow(QWidget):
     def mouseMoveEvent(self, event) -> None:
         if self._dragging and self._drag_start_pos is not None:
             new_pos = event.globalPosition().toPoint() - self._drag_start_pos
-            self.move(new_pos)
+            current = self._pending_pos if self._pending_pos is not None else self.pos()
+            if new_pos != current:
+                self._pending_pos = new_pos
+                if not self._move_timer.isActive():
+                    self._move_timer.start()
             event.accept()
         else:
             super().mouseMoveEvent(event)
@@ -135,10 +283,19 @@ class OverlayWindow(QWidget):
         if event.button() == Qt.LeftButton and self._dragging:
             self._dragging = False
             self._drag_start_pos = None
+            # Apply any coalesced move before saving
+            self._move_timer.stop()
+            self._apply_pending_move()
             # Persist the new position
             x = self.x()
             y = self.y()
             set_window_position(x, y)
             event.accept()
         else:
-            super().mouseReleaseEvent(event)
\ No newline at end of file
+            super().mouseReleaseEvent(event)
+
+    def _apply_pending_move(self) -> None:
+        """Move the window to the latest position requested by a drag."""
+        if self._pending_pos is not None:
+            self.move(self._pending_pos)
+            self._pending_pos = None
@@ -30,19 +30,28 @@ dictionary, which results in the overlay showing no pro drivers.
 
 from __future__ import annotations
 
-import json
+import logging
+import random
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Any
-
-import requests
+from typing import TYPE_CHECKING, Dict, Any, FrozenSet, Optional, Tuple
 
 from .config_manager import (
     get_last_pro_update,
+    get_pro_list_validators,
     set_last_pro_update,
+    set_pro_list_validators,
     _ensure_config_dir,
+    _json_dumps,
+    _json_loads,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    import requests
+
+logger = logging.getLogger(__name__)
+
 # Remote location of the pro driver list.
 #
 # You can host the JSON file in any web‑accessible location.  RaceMates
@@ -56,6 +65,39 @@ PRO_LIST_URL = (
 PRO_CACHE_FILENAME = "pro_drivers_cache.json"
 
 
+# HTTP session used for pro list downloads, created on first use by
+# ``_get_session`` so that importing this module does not load requests.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# In-memory copy of the pro driver map.  ``get_pro_list`` is called from
+# the telemetry poll loop, so the parsed map is kept here and the cache
+# file is only re-read when its modification time changes.
+_PRO_MAP_CACHE: Optional[Dict[int, Dict[str, Any]]] = None
+# Timestamp of the last successful remote refresh (mirrors the config).
+_PRO_MAP_CACHE_TS: float = 0.0
+# Modification time of the cache file when it was last loaded.
+_PRO_MAP_CACHE_MTIME: float = 0.0
+# Guards the in-memory cache, which background refreshes swap in.
+_PRO_MAP_LOCK = threading.Lock()
+# Lookup index derived from the pro map (see ``get_pro_index``) and the
+# map it was built from.
+_PRO_INDEX: Optional[Tuple[FrozenSet[int], Dict[int, Tuple[str, str]]]] = None
+_PRO_INDEX_SOURCE: Optional[Dict[int, Dict[str, Any]]] = None
+
+# Stale-while-revalidate state.  When the list is stale the cached map is
+# served immediately and the download runs on a daemon thread, which
+# never delays application exit even if the network is slow.
+# Failed downloads are retried with exponential backoff so that an
+# offline machine does not hammer the remote host.
+PRO_REFRESH_INTERVAL = 24 * 3600  # one day in seconds
+REFRESH_BACKOFF_MIN = 30.0
+REFRESH_BACKOFF_MAX = 3600.0
+_refresh_in_flight = threading.Event()
+_refresh_backoff: float = 0.0
+_next_refresh_attempt: float = 0.0
+
+
 def _get_cache_path() -> Path:
     """Return the path to the cached pro driver list file."""
     return _ensure_config_dir() / PRO_CACHE_FILENAME
@@ -74,8 +116,7 @@ def _read_cache() -> Dict[int, Dict[str, Any]]:
     if not path.exists():
         return {}
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _json_loads(path.read_bytes())
         pro_map: Dict[int, Dict[str, Any]] = {}
         for k, v in data.items():
             uid = int(k)
@@ -91,18 +132,138 @@ def _read_cache() -> Dict[int, Dict[str, Any]]:
         return {}
 
 
-def _write_cache(pro_map: Dict[int, Dict[str, Any]]) -> None:
+def _write_cache(pro_map: Dict[int, Dict[str, Any]]) -> bool:
     """Write the pro driver map to the cache file.
 
     The cache stores a mapping of ``UserID`` (string keys) to a
-    dictionary with ``Name`` and ``Description``.
+    dictionary with ``Name`` and ``Description``.  Returns True if the
+    file was written successfully.
     """
+    global _PRO_MAP_CACHE, _PRO_MAP_CACHE_MTIME
+    # Swap the new map into memory first so that it is served even if
+    # the cache file cannot be written.
+    with _PRO_MAP_LOCK:
+        _PRO_MAP_CACHE = pro_map
     path = _get_cache_path()
     try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump({str(k): v for k, v in pro_map.items()}, f, indent=2)
+        path.write_text(
+            _json_dumps({str(k): v for k, v in pro_map.items()}), encoding="utf-8"
+        )
+        # Record the new mtime to avoid a read-after-write
+        with _PRO_MAP_LOCK:
+            _PRO_MAP_CACHE_MTIME = path.stat().st_mtime
+        return True
     except Exception:
-        pass
+        return False
+
+
+def _load_cache() -> Dict[int, Dict[str, Any]]:
+    """Return the cached pro driver map, re-reading the file only if needed.
+
+    The parsed map is held in memory and the cache file is only parsed
+    again when it has been modified since it was last loaded.
+    """
+    global _PRO_MAP_CACHE, _PRO_MAP_CACHE_MTIME
+    try:
+        mtime = _get_cache_path().stat().st_mtime
+    except OSError:
+        mtime = 0.0
+    with _PRO_MAP_LOCK:
+        if _PRO_MAP_CACHE is None or mtime != _PRO_MAP_CACHE_MTIME:
+            _PRO_MAP_CACHE = _read_cache()
+            _PRO_MAP_CACHE_MTIME = mtime
+        return _PRO_MAP_CACHE
+
+
+def _get_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use.
+
+    Reusing one session keeps the connection to the remote host alive
+    between refreshes, and asks for a gzip-compressed response.
+    Transient failures (timeouts, rate limiting and 5xx responses) are
+    retried a few times with jittered exponential backoff before the
+    caller falls back to the cache.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            class _JitteredRetry(Retry):
+                """``Retry`` whose exponential backoff is randomised with jitter."""
+
+                def get_backoff_time(self) -> float:
+                    backoff = super().get_backoff_time()
+                    if not backoff:
+                        return 0.0
+                    return random.uniform(0, backoff) + backoff / 2
+
+            session = requests.Session()
+            session.headers.update({"Accept-Encoding": "gzip"})
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=2,
+                    max_retries=_JitteredRetry(
+                        total=3,
+                        backoff_factor=0.5,
+                        status_forcelist=[408, 429, 500, 502, 503, 504, 522, 524],
+                        allowed_methods=["GET"],
+                    )
+                ),
+            )
+            _SESSION = session
+        return _SESSION
+
+
+def _download_pro_list() -> Dict[int, Dict[str, Any]]:
+    """Download the pro driver list from ``PRO_LIST_URL`` and cache it.
+
+    Unlike ``fetch_and_cache_pro_list`` this raises on failure so that
+    callers can tell a failed download apart from an empty list.  The
+    request is conditional on the ``ETag``/``Last-Modified`` of the
+    cached copy; if the server answers ``304 Not Modified`` the cache
+    is kept as is.
+    """
+    global _PRO_MAP_CACHE_TS
+    headers: Dict[str, str] = {}
+    cached = _load_cache()
+    if cached:
+        etag, last_modified = get_pro_list_validators()
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    response = _get_session().get(PRO_LIST_URL, headers=headers, timeout=10)
+    if response.status_code == 304 and cached:
+        _PRO_MAP_CACHE_TS = time.time()
+        set_last_pro_update(_PRO_MAP_CACHE_TS)
+        return cached
+    response.raise_for_status()
+    data = _json_loads(response.content)
+    pro_map: Dict[int, Dict[str, Any]] = {}
+    for item in data:
+        try:
+            uid = int(item["UserID"])
+            name = str(item["Name"])
+            desc = str(item.get("Description", ""))
+            pro_map[uid] = {"Name": name, "Description": desc}
+        except (KeyError, ValueError, TypeError):
+            continue
+    # Cache the list and update timestamp.  The validators and the
+    # persisted timestamp describe the cache file, so they are only
+    # saved once it has actually been written; otherwise a later 304
+    # would pin an outdated file.
+    _PRO_MAP_CACHE_TS = time.time()
+    if _write_cache(pro_map):
+        set_pro_list_validators(
+            response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
+        set_last_pro_update(_PRO_MAP_CACHE_TS)
+    return pro_map
 
 
 def fetch_and_cache_pro_list() -> Dict[int, Dict[str, Any]]:
@@ -113,43 +274,86 @@ def fetch_and_cache_pro_list() -> Dict[int, Dict[str, Any]]:
     falls back to whatever is stored in the local cache.
     """
     try:
-        response = requests.get(PRO_LIST_URL, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        pro_map: Dict[int, Dict[str, Any]] = {}
-        for item in data:
-            try:
-                uid = int(item["UserID"])
-                name = str(item["Name"])
-                desc = str(item.get("Description", ""))
-                pro_map[uid] = {"Name": name, "Description": desc}
-            except (KeyError, ValueError, TypeError):
-                continue
-        # Cache the list and update timestamp
-        _write_cache(pro_map)
-        set_last_pro_update(time.time())
-        return pro_map
-    except Exception:
+        return _download_pro_list()
+    except Exception as e:
+        logger.warning("Failed to download pro driver list: %s", e)
         # On error, return cached values if available
-        return _read_cache()
+        return _load_cache()
+
+
+def _refresh_worker() -> None:
+    """Background refresh of the pro list with exponential backoff."""
+    global _refresh_backoff, _next_refresh_attempt
+    try:
+        _download_pro_list()
+        _refresh_backoff = 0.0
+        _next_refresh_attempt = 0.0
+    except Exception as e:
+        _refresh_backoff = min(
+            max(_refresh_backoff * 2, REFRESH_BACKOFF_MIN), REFRESH_BACKOFF_MAX
+        )
+        _next_refresh_attempt = time.time() + _refresh_backoff
+        logger.warning(
+            "Failed to refresh pro driver list (retrying in %.0fs): %s",
+            _refresh_backoff,
+            e,
+        )
+    finally:
+        _refresh_in_flight.clear()
+
+
+def _async_refresh() -> None:
+    """Start a background refresh unless one is running or backing off."""
+    if _refresh_in_flight.is_set() or time.time() < _next_refresh_attempt:
+        return
+    _refresh_in_flight.set()
+    threading.Thread(
+        target=_refresh_worker, name="ProListRefresh", daemon=True
+    ).start()
 
 
 def get_pro_list(force_refresh: bool = False) -> Dict[int, Dict[str, Any]]:
     """Return the pro driver map, refreshing from remote if needed.
 
     By default this function checks whether 24 hours have elapsed
-    since the last successful refresh.  Set ``force_refresh=True`` to
-    bypass this check.
+    since the last successful refresh.  If so, the cached map is
+    returned immediately and the refresh runs in the background, so
+    callers never block on the network.  Set ``force_refresh=True`` to
+    download synchronously regardless of the age of the cache.
     """
-    # Determine if we need to refresh
-    refresh_interval = 24 * 3600  # one day in seconds
-    last_update = get_last_pro_update()
-    if force_refresh or (time.time() - last_update) > refresh_interval:
+    global _PRO_MAP_CACHE_TS
+    if force_refresh:
         pro_map = fetch_and_cache_pro_list()
         if pro_map:
             return pro_map
-    # Fallback to cache
-    return _read_cache()
+    else:
+        if not _PRO_MAP_CACHE_TS:
+            _PRO_MAP_CACHE_TS = get_last_pro_update()
+        if (time.time() - _PRO_MAP_CACHE_TS) > PRO_REFRESH_INTERVAL:
+            _async_refresh()
+    # Serve whatever is cached
+    return _load_cache()
+
+
+def get_pro_index() -> Tuple[FrozenSet[int], Dict[int, Tuple[str, str]]]:
+    """Return the pro driver map as ``(uids, info)`` for fast filtering.
+
+    ``uids`` is a frozenset of all pro ``UserID`` values, suitable for
+    intersecting with the IDs in a session, and ``info`` maps each ID to
+    a ``(Name, Description)`` tuple.  The index is rebuilt only when the
+    underlying pro map changes, so repeated calls return the same
+    objects.
+    """
+    global _PRO_INDEX, _PRO_INDEX_SOURCE
+    pro_map = get_pro_list()
+    if _PRO_INDEX is None or pro_map is not _PRO_INDEX_SOURCE:
+        info = {
+            uid: (entry.get("Name", ""), entry.get("Description", ""))
+            for uid, entry in pro_map.items()
+        }
+        _PRO_INDEX = (frozenset(info), info)
+        _PRO_INDEX_SOURCE = pro_map
+    return _PRO_INDEX
 
 
 def is_pro_driver(user_id: int) -> bool:
@@ -5,8 +5,8 @@ This module provides a ``TelemetryListener`` class which connects to the
 iRacing SDK via ``pyirsdk``, monitors the player's session state, and
 emits updates about the list of drivers currently in the session.
 
-``TelemetryListener`` runs in its own thread and emits Qt signals
-using the PySide6 framework.  The overlay subscribes to these
+``TelemetryListener`` is a ``QThread`` and emits Qt signals using the
+PySide6 framework.  The overlay subscribes to these
 signals to update its display.  The class is careful not to
 interrogate the SDK unless it is connected and initialised.  When
 there are no valid telemetry data (e.g. iRacing is not running) the
@@ -18,28 +18,27 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, FrozenSet, Tuple
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QThread, Signal
 
-try:
-    import irsdk  # type: ignore
-except ImportError as exc:  # pragma: no cover - runtime dependency
-    raise ImportError(
-        "The pyirsdk package is required to run RaceMates. "
-        "Install it with 'pip install pyirsdk'."
-    ) from exc
-
-from .prolist_manager import get_pro_list
+from .prolist_manager import get_pro_index
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How often (seconds) the poll loop re-fetches the pro driver index.
+PRO_MAP_REFRESH_INTERVAL = 60.0
+
+# Successive waits (seconds) while iRacing is not connected.  The last
+# value is used for every subsequent retry.
+DISCONNECTED_WAITS = (2.0, 5.0)
+
 
-class TelemetryListener(QObject):
+class TelemetryListener(QThread):
     """Monitor iRacing telemetry and emit driver updates."""
 
-    drivers_updated = Signal(list)  # List[Dict[str, Any]]
+    drivers_updated = Signal(int)  # generation of the list returned by snapshot()
     session_active = Signal(bool)  # bool indicating whether the overlay should be shown
 
     def __init__(self, poll_interval: float = 0.2) -> None:
@@ -49,45 +48,125 @@ class TelemetryListener(QObject):
             poll_interval: The interval in seconds between telemetry polls.
         """
         super().__init__()
+        self.setObjectName("TelemetryListener")
         self.poll_interval = poll_interval
-        self._running = False
-        self._thread: threading.Thread | None = None
-        self.ir = irsdk.IRSDK()
+        self._stop_event = threading.Event()
+        # Last emitted payloads, used to suppress redundant signals
+        self._last_emit: tuple | None = None
+        self._last_session_active: bool | None = None
+        # Latest pro driver list; the GUI pulls it via ``snapshot`` when
+        # ``drivers_updated`` fires instead of receiving it in the signal
+        self._latest_lock = threading.Lock()
+        self._latest: List[Dict[str, Any]] = []
+        self._generation = 0
+        # ``irsdk.IRSDK`` instance, created on the first ``start()`` so
+        # that importing this module does not load pyirsdk
+        self.ir = None
 
     def start(self) -> None:
         """Start the telemetry listener thread."""
-        if self._running:
+        if self.isRunning():
             return
-        self._running = True
-        self._thread = threading.Thread(
-            target=self._run, name="TelemetryListener", daemon=True
-        )
-        self._thread.start()
+        if self.ir is None:
+            try:
+                import irsdk  # type: ignore
+            except ImportError as exc:  # pragma: no cover - runtime dependency
+                raise ImportError(
+                    "The pyirsdk package is required to run RaceMates. "
+                    "Install it with 'pip install pyirsdk'."
+                ) from exc
+            self.ir = irsdk.IRSDK()
+        self._stop_event.clear()
+        super().start()
 
     def stop(self) -> None:
-        """Signal the telemetry listener to stop."""
-        self._running = False
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=1.0)
+        """Signal the telemetry listener to stop and wait for it to finish.
+
+        Every wait in ``run`` returns as soon as the stop event is set, so
+        this only blocks for the SDK call in progress.  The wait has no
+        deadline because destroying a ``QThread`` that is still running
+        aborts the process.
+        """
+        self._stop_event.set()
+        if self.isRunning():
+            self.wait()
+
+    def snapshot(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """Return ``(generation, pro_drivers)`` for the latest driver list.
+
+        Safe to call from any thread.  The generation increases each time
+        ``drivers_updated`` is emitted.
+        """
+        with self._latest_lock:
+            return self._generation, self._latest
+
+    def _emit_session_active(self, active: bool) -> bool:
+        """Emit ``session_active`` only when the state changes.
 
-    def _run(self) -> None:
-        """Worker method that runs in a background thread."""
+        Returns True if the state changed and the signal was emitted.
+        """
+        if active == self._last_session_active:
+            return False
+        self._last_session_active = active
+        self.session_active.emit(active)
+        return True
+
+    def _emit_drivers(self, pro_drivers: List[Dict[str, Any]]) -> None:
+        """Emit ``drivers_updated`` only when the list differs from the last one."""
+        key = tuple(
+            (d["UserID"], d["CarNumber"], d["Name"], d["Description"])
+            for d in pro_drivers
+        )
+        if key == self._last_emit:
+            return
+        self._last_emit = key
+        with self._latest_lock:
+            self._latest = pro_drivers
+            self._generation += 1
+            generation = self._generation
+        self.drivers_updated.emit(generation)
+
+    def run(self) -> None:
+        """Worker method that runs in the listener thread."""
         # Attempt to initialise the SDK.  This is safe to call repeatedly.
         try:
             self.ir.startup()
         except Exception as e:
             logger.error("Failed to start pyirsdk: %s", e)
             # Wait before retrying
-            time.sleep(5)
+            if self._stop_event.wait(5):
+                return
 
-        while self._running:
+        # The pro list and the driver roster change rarely, so the pro
+        # index is only re-fetched periodically and the pro driver list
+        # is only rebuilt when the roster (or the pro list) changes.
+        pro_uids: FrozenSet[int] = frozenset()
+        pro_info: Dict[int, Tuple[str, str]] = {}
+        last_pro_map_refresh: float | None = None
+        last_driver_info_hash: int | None = None
+        # DriverInfo lives in the session info YAML, which iRacing only
+        # rewrites when the header's ``session_info_update`` changes.
+        drivers: List[Dict[str, Any]] = []
+        last_session_info_update: int | None = None
+        disconnected_polls = 0
+
+        while not self._stop_event.is_set():
             try:
                 if not (self.ir.is_initialized and self.ir.is_connected):
-                    # Not connected; wait and try again
-                    self.session_active.emit(False)
-                    time.sleep(self.poll_interval)
+                    # Not connected; back off and try again
+                    self._emit_session_active(False)
+                    last_session_info_update = None
+                    wait = DISCONNECTED_WAITS[
+                        min(disconnected_polls, len(DISCONNECTED_WAITS) - 1)
+                    ]
+                    disconnected_polls += 1
+                    if self._stop_event.wait(wait):
+                        return
                     continue
-                # Query session state and on-track status
+                disconnected_polls = 0
+                # Query session state and on-track status from a single
+                # frozen snapshot of the telemetry buffer
+                self.ir.freeze_var_buffer_latest()
                 try:
                     session_state = self.ir["SessionState"]
                     is_on_track = self.ir["IsOnTrack"]
@@ -95,48 +174,88 @@ class TelemetryListener(QObject):
                     # If the variables are missing, treat as inactive
                     session_state = 0
                     is_on_track = 0
+                finally:
+                    self.ir.unfreeze_var_buffer_latest()
+                # The session info version is a header field, not a
+                # telemetry variable, so it is read outside the var buffer
+                session_info_update = self.ir.session_info_update
 
                 # Determine if we should display the overlay
                 active = (session_state == 4) and (is_on_track == 1)
-                self.session_active.emit(bool(active))
+                if self._emit_session_active(bool(active)) and not active:
+                    # Clear the list once when leaving the track; nothing
+                    # more is emitted until the session becomes active again
+                    self._emit_drivers([])
+                    last_driver_info_hash = None
 
                 if active:
-                    # Fetch the list of drivers in session
-                    try:
-                        driver_info = self.ir["DriverInfo"]
-                        drivers = (
-                            driver_info.get("Drivers", [])
-                            if isinstance(driver_info, dict)
-                            else []
+                    # Fetch the list of drivers in session when the
+                    # session info has been updated
+                    if (
+                        session_info_update is None
+                        or session_info_update != last_session_info_update
+                    ):
+                        try:
+                            driver_info = self.ir["DriverInfo"]
+                            drivers = (
+                                driver_info.get("Drivers", [])
+                                if isinstance(driver_info, dict)
+                                else []
+                            )
+                            last_session_info_update = session_info_update
+                        except Exception as e:
+                            logger.error("Error reading DriverInfo: %s", e)
+                            drivers = []
+                            last_session_info_update = None
+
+                    now = time.monotonic()
+                    # Ask every tick while the index is still empty (e.g. the
+                    # first download is running in the background)
+                    if (
+                        last_pro_map_refresh is None
+                        or not pro_uids
+                        or now - last_pro_map_refresh >= PRO_MAP_REFRESH_INTERVAL
+                    ):
+                        uids, info = get_pro_index()
+                        last_pro_map_refresh = now
+                        if uids is not pro_uids:
+                            pro_uids, pro_info = uids, info
+                            last_driver_info_hash = None
+
+                    h = hash(
+                        tuple(
+                            (d.get("UserID"), d.get("CarNumber")) for d in drivers
                         )
-                    except Exception as e:
-                        logger.error("Error reading DriverInfo: %s", e)
-                        drivers = []
+                    )
+                    if h == last_driver_info_hash:
+                        # Roster unchanged; the overlay is already up to date
+                        if self._stop_event.wait(self.poll_interval):
+                            return
+                        continue
+                    last_driver_info_hash = h
 
-                    pro_map = get_pro_list()
+                    # Intersect the session's IDs with the pro IDs and only
+                    # build entries for the matches, keeping session order
+                    matched = {d.get("UserID") for d in drivers} & pro_uids
                     pro_drivers: List[Dict[str, Any]] = []
-                    for drv in drivers:
-                        try:
-                            uid = int(drv.get("UserID"))
-                            # Only include drivers present in our pro list
-                            if uid in pro_map:
-                                entry = pro_map[uid]
+                    if matched:
+                        for drv in drivers:
+                            uid = drv.get("UserID")
+                            if uid in matched:
+                                name, desc = pro_info[uid]
                                 pro_drivers.append(
                                     {
                                         "UserID": uid,
-                                        "Name": entry.get("Name", ""),
-                                        "Description": entry.get("Description", ""),
+                                        "Name": name,
+                                        "Description": desc,
                                         "CarNumber": drv.get("CarNumber", ""),
                                     }
                                 )
-                        except Exception:
-                            continue
                     # Emit updated list (could be empty)
-                    self.drivers_updated.emit(pro_drivers)
-                else:
-                    # When not active emit empty list
-                    self.drivers_updated.emit([])
-                time.sleep(self.poll_interval)
+                    self._emit_drivers(pro_drivers)
+                if self._stop_event.wait(self.poll_interval):
+                    return
             except Exception as ex:
                 logger.error("Unhandled exception in telemetry listener: %s", ex)
-                time.sleep(self.poll_interval)
+                if self._stop_event.wait(self.poll_interval):
+                    return